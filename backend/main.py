@@ -1,43 +1,163 @@
 import uvicorn
-import json
-from fastapi import FastAPI, Request
+import asyncio
+import io
+from collections import deque
+from contextlib import asynccontextmanager
+import numpy as np
+import orjson
+from functools import lru_cache
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 from pydantic import BaseModel
 from biosat_core import (get_demo_telemetry, OrbitSimulator,
                          estimate_radiation, sat_ground_distance_km,
                          trans_prob_from_distance, transmit_bb84,
-                         aesgcm_encrypt_with_bits, aesgcm_decrypt_with_bits,
-                         predict_risk)
+                         aesgcm_encrypt,
+                         predict_risk_batch)
 from biosat_core import orbit_sim 
 
 
-app = FastAPI(title="BioSat-Q+ Backend")
+class ORJSONResponse(Response):
+    """JSON response rendered with orjson, serializing NumPy arrays natively."""
+    media_type = "application/json"
 
-KEY_BUFFER = ""  
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+KEY_BYTES = 16
+KEY_COMPACT_AT = 4096
+KEY_BUFFER = bytearray()
+_KEY_READ_OFF = 0
 LAST_QKD = {}
+# Sealed payloads awaiting the secure downlink; bounded so long runs don't grow it without limit
+SEALED_OUTBOX = deque(maxlen=1024)
 
 GS_LAT, GS_LON = 0.0, 0.0
 
+RISK_BATCH_WINDOW_S = 0.005
+RISK_BATCH_MAX = 64
+INGEST_BATCH_MAX = 256
+_RISK_QUEUE = None
+_RISK_TASK = None
+_RISK_LOOP = None
+_RISK_FEATURES = np.empty((RISK_BATCH_MAX, 4), dtype=np.float32)
+
 class OrbitParams(BaseModel):
     """Defines the input parameters for the orbital calculation."""
     semi_major_axis: float = 7000.0
     eccentricity: float = 0.3
 
 
+def _key_buffer_bits():
+    return 8 * (len(KEY_BUFFER) - _KEY_READ_OFF)
+
+
+def _take_key():
+    """Consumes one AES key from the front of KEY_BUFFER, compacting it periodically."""
+    global _KEY_READ_OFF
+    key = bytes(KEY_BUFFER[_KEY_READ_OFF:_KEY_READ_OFF + KEY_BYTES])
+    _KEY_READ_OFF += KEY_BYTES
+    if _KEY_READ_OFF >= KEY_COMPACT_AT:
+        del KEY_BUFFER[:_KEY_READ_OFF]
+        _KEY_READ_OFF = 0
+    return key
+
+
+async def _risk_batcher():
+    """Collects pending risk predictions for a short window and scores them in one call."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await _RISK_QUEUE.get()]
+        deadline = loop.time() + RISK_BATCH_WINDOW_S
+        while len(batch) < RISK_BATCH_MAX:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_RISK_QUEUE.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        try:
+            for i, (features, _) in enumerate(batch):
+                _RISK_FEATURES[i] = features
+            results = predict_risk_batch(_RISK_FEATURES[:len(batch)])
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            continue
+        for (_, fut), res in zip(batch, results):
+            if not fut.done():
+                fut.set_result(res)
+
+
+def _ensure_risk_batcher():
+    """(Re)starts the batcher on the running loop if it is missing, finished or bound to another loop."""
+    global _RISK_QUEUE, _RISK_TASK, _RISK_LOOP
+    loop = asyncio.get_running_loop()
+    if _RISK_LOOP is not loop or _RISK_TASK is None or _RISK_TASK.done():
+        _RISK_QUEUE = asyncio.Queue()
+        _RISK_TASK = loop.create_task(_risk_batcher())
+        _RISK_LOOP = loop
+
+
+def _risk_features(hr, spo2, temp, radiation):
+    try:
+        return (float(hr), float(spo2), float(temp), float(radiation))
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=422, detail="hr, spo2, temp and radiation must be numeric")
+
+
+async def batched_predict_risk(hr, spo2, temp, radiation):
+    features = _risk_features(hr, spo2, temp, radiation)
+    _ensure_risk_batcher()
+    fut = asyncio.get_running_loop().create_future()
+    await _RISK_QUEUE.put((features, fut))
+    return await fut
+
+
+@asynccontextmanager
+async def lifespan(app):
+    _ensure_risk_batcher()
+    yield
+    _RISK_TASK.cancel()
+
+
+app = FastAPI(title="BioSat-Q+ Backend", default_response_class=ORJSONResponse, lifespan=lifespan)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+NPZ_MEDIA_TYPE = "application/x-npz"
+
+
+@lru_cache(maxsize=256)
+def _orbit_npz(a, e):
+    """Packs a cached orbit as .npz bytes (float32 paths, 0-d scalars); GZipMiddleware compresses it."""
+    buf = io.BytesIO()
+    np.savez(buf, **orbit_sim.calculate_orbit_cached(a, e))
+    return buf.getvalue()
+
+
 @app.post("/simulate_orbit")
-async def simulate_orbit(params: OrbitParams):
+async def simulate_orbit(params: OrbitParams, request: Request):
     """
     Calculates the satellite's trajectory based on semi-major axis (a) 
     and eccentricity (e) and returns the coordinates for frontend plotting.
+    Clients sending `Accept: application/x-npz` get the raw arrays as .npz.
     """
     try:
-        trajectory_data = orbit_sim.calculate_orbit(
-            a=params.semi_major_axis, 
-            e=params.eccentricity
+        if NPZ_MEDIA_TYPE in request.headers.get("accept", ""):
+            return Response(_orbit_npz(params.semi_major_axis, params.eccentricity),
+                            media_type=NPZ_MEDIA_TYPE)
+        trajectory_data = orbit_sim.calculate_orbit_cached(
+            params.semi_major_axis,
+            params.eccentricity
         )
-        return {
+        return ORJSONResponse({
             "status": "success",
             "data": trajectory_data
-        }
+        })
     except ValueError as e:
         return {
             "status": "error",
@@ -55,58 +175,84 @@ async def run_qkd(n_photons: int = 2000, alt_km: float = 500.0, sat_lat: float =
     d = sat_ground_distance_km(alt_km, GS_LAT, GS_LON, sat_lat, sat_lon)
     trans_prob = trans_prob_from_distance(d)
     res = transmit_bb84(n_photons, trans_prob, error_prob)
-    global KEY_BUFFER, LAST_QKD
-    KEY_BUFFER += res["sifted_key"]
+    global LAST_QKD
+    key_bytes = res.pop("sifted_bytes")[:res["R_secure_bits"] // 8]
+    KEY_BUFFER.extend(key_bytes)
     LAST_QKD = {"distance_km": d, "trans_prob": trans_prob, **res}
-    return {"added_bits": res["R_secure_bits"], "key_buffer_len": len(KEY_BUFFER), "qkd_stats": LAST_QKD}
+    return {"added_bits": 8 * len(key_bytes), "key_buffer_len": _key_buffer_bits(), "qkd_stats": LAST_QKD}
 
-@app.post("/ingest")
-async def ingest(request: Request):
-    data = await request.json()
-    global KEY_BUFFER
-    payload_bytes = json.dumps(data).encode()
+def _json_body(payload_bytes):
+    try:
+        return orjson.loads(payload_bytes)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=422, detail="request body is not valid JSON")
+
+def _radiation_param(request):
     try:
-        radiation = float(request.query_params.get("radiation", 0.1))
+        return float(request.query_params.get("radiation", 0.1))
     except ValueError:
-        radiation = 0.1
+        return 0.1
 
-    if len(KEY_BUFFER) >= 128:
-        key_bits = KEY_BUFFER[:128]
-        KEY_BUFFER = KEY_BUFFER[128:]
-        
-        ct = aesgcm_encrypt_with_bits(key_bits, payload_bytes)
+@app.post("/ingest")
+async def ingest(request: Request):
+    payload_bytes = await request.body()
+    data = _json_body(payload_bytes)
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=422, detail="expected a JSON object")
+    radiation = _radiation_param(request)
+
+    # Score first: a payload the model rejects must not consume a QKD key
+    ml_res = await batched_predict_risk(
+        data.get("hr", 75), 
+        data.get("spo2", 98), 
+        data.get("temp", 36.5), 
+        radiation
+    )
+    if len(KEY_BUFFER) - _KEY_READ_OFF >= KEY_BYTES:
+        key = _take_key()
         
-        try:
-            pt = aesgcm_decrypt_with_bits(key_bits, ct)
-            telemetry = json.loads(pt.decode())
-        except Exception as e:
-            telemetry = data 
-            return {"status":"error", "error": f"Decryption Failed: {str(e)}", "key_buffer_len": len(KEY_BUFFER)}
+        # Seal the payload for the secure channel; the plaintext is already
+        # parsed, so the model scored it directly instead of decrypting ct.
+        SEALED_OUTBOX.append(aesgcm_encrypt(key, payload_bytes))
         
-        ml_res = predict_risk(
-            telemetry.get("hr", 75), 
-            telemetry.get("spo2", 98), 
-            telemetry.get("temp", 36.5), 
-            radiation
-        )
-        return {"status":"ok", "secure":True, "ml": ml_res, "key_buffer_len": len(KEY_BUFFER)}
+        return {"status":"ok", "secure":True, "ml": ml_res, "key_buffer_len": _key_buffer_bits()}
     else:
-        ml_res = predict_risk(
-            data.get("hr", 75), 
-            data.get("spo2", 98), 
-            data.get("temp", 36.5), 
-            radiation
-        )
-        return {"status":"ok", "secure":False, "ml": ml_res, "reason":"not_enough_qkd_bits", "key_buffer_len": len(KEY_BUFFER)}
+        return {"status":"ok", "secure":False, "ml": ml_res, "reason":"not_enough_qkd_bits", "key_buffer_len": _key_buffer_bits()}
+
+@app.post("/ingest_batch")
+async def ingest_batch(request: Request):
+    """
+    Ingests a JSON list of samples in one round-trip, scoring them in one
+    model call. One QKD key seals the received body for the whole batch.
+    """
+    payload_bytes = await request.body()
+    samples = _json_body(payload_bytes)
+    if not isinstance(samples, list) or not all(isinstance(s, dict) for s in samples):
+        raise HTTPException(status_code=422, detail="expected a JSON list of samples")
+    if len(samples) > INGEST_BATCH_MAX:
+        raise HTTPException(status_code=413, detail=f"at most {INGEST_BATCH_MAX} samples per batch")
+    if not samples:
+        return []
+    radiation = _radiation_param(request)
+    X = np.array([_risk_features(s.get("hr", 75), s.get("spo2", 98), s.get("temp", 36.5), radiation)
+                  for s in samples], dtype=np.float32)
+    ml = predict_risk_batch(X)
+    if len(KEY_BUFFER) - _KEY_READ_OFF >= KEY_BYTES:
+        SEALED_OUTBOX.append(aesgcm_encrypt(_take_key(), payload_bytes))
+        status = {"status":"ok", "secure":True, "key_buffer_len": _key_buffer_bits()}
+    else:
+        status = {"status":"ok", "secure":False, "reason":"not_enough_qkd_bits", "key_buffer_len": _key_buffer_bits()}
+    return [{**status, "ml": ml_res} for ml_res in ml]
 
 @app.get("/status")
 async def status():
-    return {"key_buffer_len": len(KEY_BUFFER), "last_qkd": LAST_QKD}
+    return {"key_buffer_len": _key_buffer_bits(), "sealed_outbox_len": len(SEALED_OUTBOX), "last_qkd": LAST_QKD}
 
 @app.get("/simtelemetry")
 async def simtelemetry():
     return get_demo_telemetry()
 
 if __name__ == "__main__":
-    uvicorn.run("backend.main:app", host="0.0.0.0", port=8000, reload=True)
+    # Single worker: the QKD key buffer is in-process state
+    uvicorn.run("backend.main:app", host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
 
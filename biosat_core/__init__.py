@@ -1,10 +1,11 @@
 from .data_sensor import get_demo_telemetry
 from .orbit_sim import OrbitSimulator, estimate_radiation, sat_ground_distance_km
 from .quantum_sim import transmit_bb84, trans_prob_from_distance, entanglement_fidelity
-from .crypto_utils import bits_to_bytes, aesgcm_encrypt_with_bits, aesgcm_decrypt_with_bits
-from .ml_model import train_and_save_model, load_model, predict_risk
+from .crypto_utils import (bits_to_bytes, aesgcm_encrypt, aesgcm_decrypt,
+                           aesgcm_encrypt_with_bits, aesgcm_decrypt_with_bits)
+from .ml_model import train_and_save_model, load_model, predict_risk, predict_risk_batch
 
 __all__ = ["get_demo_telemetry","OrbitSimulator","estimate_radiation","sat_ground_distance_km",
            "transmit_bb84","trans_prob_from_distance","entanglement_fidelity",
-           "bits_to_bytes","aesgcm_encrypt_with_bits","aesgcm_decrypt_with_bits",
-           "train_and_save_model","load_model","predict_risk"]
+           "bits_to_bytes","aesgcm_encrypt","aesgcm_decrypt","aesgcm_encrypt_with_bits","aesgcm_decrypt_with_bits",
+           "train_and_save_model","load_model","predict_risk","predict_risk_batch"]
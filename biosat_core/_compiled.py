@@ -0,0 +1,21 @@
+"""
+Ahead-of-time build of the Numba kernels into the ``_biosat_native``
+extension module, so the server does not pay JIT latency on its first
+request. Run at build time with::
+
+    python -m biosat_core._compiled
+
+quantum_sim imports the extension when present and otherwise falls back
+to the JIT-compiled (or pure NumPy) path.
+"""
+import os
+from numba.pycc import CC
+from biosat_core.quantum_sim import _bb84_kernel
+
+cc = CC('_biosat_native')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export('bb84_core', 'Tuple((u1[:], u1[:], b1[:], b1[:]))(i8, f8, f8, i8)')(_bb84_kernel)
+
+if __name__ == "__main__":
+    cc.compile()
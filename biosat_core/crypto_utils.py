@@ -1,24 +1,32 @@
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+import numpy as np
 import os
 
 def bits_to_bytes(key_bits, length_bytes=16):
     needed = length_bytes * 8
     if len(key_bits) < needed:
         raise ValueError("Not enough key bits")
-    key_bytes = int(key_bits[:needed], 2).to_bytes(length_bytes, "big")
+    bits = np.frombuffer(key_bits[:needed].encode("ascii"), dtype=np.uint8) - ord("0")
+    if (bits > 1).any():
+        raise ValueError("Key bits must be '0' or '1'")
+    key_bytes = np.packbits(bits).tobytes()
     return key_bytes
 
-def aesgcm_encrypt_with_bits(key_bits, plaintext_bytes):
-    key = bits_to_bytes(key_bits, 16)
-    aesgcm = AESGCM(key)
+def aesgcm_encrypt(key_bytes, plaintext_bytes):
+    aesgcm = AESGCM(bytes(key_bytes))
     nonce = os.urandom(12)
     ct = aesgcm.encrypt(nonce, plaintext_bytes, None)
     return nonce + ct
 
-def aesgcm_decrypt_with_bits(key_bits, ciphertext_bytes):
-    key = bits_to_bytes(key_bits, 16)
-    aesgcm = AESGCM(key)
+def aesgcm_decrypt(key_bytes, ciphertext_bytes):
+    aesgcm = AESGCM(bytes(key_bytes))
     nonce = ciphertext_bytes[:12]
     ct = ciphertext_bytes[12:]
     pt = aesgcm.decrypt(nonce, ct, None)
     return pt
+
+def aesgcm_encrypt_with_bits(key_bits, plaintext_bytes):
+    return aesgcm_encrypt(bits_to_bytes(key_bits, 16), plaintext_bytes)
+
+def aesgcm_decrypt_with_bits(key_bits, ciphertext_bytes):
+    return aesgcm_decrypt(bits_to_bytes(key_bits, 16), ciphertext_bytes)
@@ -1,8 +1,8 @@
 import dash
-from dash import dcc, html, Input, Output, State, callback_context
+from dash import dcc, html, dash_table, Input, Output, State, callback_context
 import plotly.graph_objs as go
 import requests
-import pandas as pd
+import orjson
 import numpy as np
 from datetime import datetime
 import sys
@@ -20,6 +20,26 @@ except ImportError:
         return 0.1 + (alt_km / 1000) * 0.05
 
 API_ROOT = "http://localhost:8000"
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+def read_json(response):
+    return orjson.loads(response.content)
+
+TELEMETRY_COLUMNS = ['Time', 'HR', 'SpO2', 'Temp', 'RiskProb', 'Secure', 'KeyBufLen']
+TELEMETRY_MAX_POINTS = 50
+
+# Initial live-telemetry figure; points are appended client-side via extendData
+TELEMETRY_FIGURE = go.Figure(
+    data=[go.Scatter(x=[], y=[], name='Risk Prob', mode='lines'),
+          go.Scatter(x=[], y=[], name='Key Buffer', mode='lines', yaxis='y2')],
+    layout=dict(
+        title="Live Telemetry Metrics",
+        xaxis=dict(title='Time'),
+        yaxis=dict(title='Risk Probability'),
+        yaxis2=dict(title='Key Buffer Length', overlaying='y', side='right'),
+        hovermode='x unified'
+    )
+)
 
 app = dash.Dash(__name__, suppress_callback_exceptions=True)
 app.title = "BioSat-Q+ Dashboard"
@@ -101,7 +121,10 @@ app.layout = html.Div([
                 dcc.Slider(id='poll-interval', min=1, max=5, value=1, step=1,
                           marks={1: '1', 3: '3', 5: '5'}),
                 html.Div(id='telemetry-output'),
-                dcc.Graph(id='telemetry-chart'),
+                dash_table.DataTable(id='telemetry-table',
+                                     columns=[{'name': c, 'id': c} for c in TELEMETRY_COLUMNS],
+                                     data=[], style_cell={'fontSize': '12px'}),
+                dcc.Graph(id='telemetry-chart', figure=TELEMETRY_FIGURE),
                 dcc.Interval(id='telemetry-interval', interval=1000, disabled=True),
             ], style={'width': '35%', 'display': 'inline-block', 'verticalAlign': 'top', 'padding': '20px'}),
             
@@ -114,6 +137,7 @@ app.layout = html.Div([
     # Hidden divs to store data
     dcc.Store(id='orbit-data-store'),
     dcc.Store(id='telemetry-data-store', data=[]),
+    dcc.Store(id='telemetry-sample'),
 ], style={'fontFamily': 'Arial, sans-serif'})
 
 # --- CALLBACKS ---
@@ -125,7 +149,7 @@ app.layout = html.Div([
 )
 def update_status(n):
     try:
-        status = requests.get(f"{API_ROOT}/status", timeout=3).json()
+        status = read_json(requests.get(f"{API_ROOT}/status", timeout=3))
         return html.Div([
             html.P(f"Key buffer length: {status.get('key_buffer_len', 0)} bits", style={'fontWeight': 'bold'}),
             html.P("Last QKD Session:"),
@@ -151,10 +175,10 @@ def run_qkd(n_clicks, n_photons, alt_km, sat_lat, sat_lon, error_prob):
     if n_clicks == 0:
         return ""
     try:
-        r = requests.post(f"{API_ROOT}/qkd/run_session", params={
+        r = read_json(requests.post(f"{API_ROOT}/qkd/run_session", params={
             "n_photons": n_photons, "alt_km": alt_km, "sat_lat": sat_lat, 
             "sat_lon": sat_lon, "error_prob": error_prob
-        }, timeout=10).json()
+        }, timeout=10))
         return html.Div(f"✓ Added {r.get('added_bits',0)} bits — buffer {r.get('key_buffer_len')}", 
                        style={'color': 'green'})
     except:
@@ -176,15 +200,17 @@ def start_orbit_simulation(n_clicks, a, e):
     try:
         response = requests.post(
             f"{API_ROOT}/simulate_orbit",
-            json={"semi_major_axis": a, "eccentricity": e}
+            data=orjson.dumps({"semi_major_axis": a, "eccentricity": e}),
+            headers=JSON_HEADERS
         )
+        body = read_json(response)
         
-        if response.status_code == 200 and response.json().get("status") == "success":
-            orbit_data = response.json()["data"]
+        if response.status_code == 200 and body.get("status") == "success":
+            orbit_data = body["data"]
             orbit_data['current_frame'] = 0
             return orbit_data, html.Div("✓ Orbit Calculated! Animating...", style={'color': 'green'}), False
         else:
-            return None, html.Div(f"✗ Error: {response.json().get('message', 'Unknown')}", 
+            return None, html.Div(f"✗ Error: {body.get('message', 'Unknown')}", 
                                  style={'color': 'red'}), True
     except:
         return None, html.Div("✗ Backend unreachable", style={'color': 'red'}), True
@@ -278,66 +304,53 @@ def toggle_telemetry_polling(auto_poll, poll_interval):
 def update_poll_interval(interval):
     return interval * 1000
 
-# Telemetry Update
+# Telemetry Update (server side: fetch one sample only)
 @app.callback(
-    [Output('telemetry-output', 'children'),
-     Output('telemetry-chart', 'figure'),
-     Output('telemetry-data-store', 'data')],
+    [Output('telemetry-sample', 'data'),
+     Output('telemetry-output', 'children')],
     Input('telemetry-interval', 'n_intervals'),
-    State('telemetry-data-store', 'data'),
     State('alt-slider', 'value')
 )
-def update_telemetry(n, data_log, alt_km):
-    if not data_log:
-        data_log = []
-    
+def update_telemetry(n, alt_km):
     try:
-        tele = requests.get(f"{API_ROOT}/simtelemetry", timeout=3).json()
+        tele = read_json(requests.get(f"{API_ROOT}/simtelemetry", timeout=3))
         radiation = estimate_radiation(alt_km)
-        res = requests.post(f"{API_ROOT}/ingest", json=tele, params={"radiation": radiation}, timeout=5).json()
+        res = read_json(requests.post(f"{API_ROOT}/ingest", data=orjson.dumps(tele), headers=JSON_HEADERS,
+                                      params={"radiation": radiation}, timeout=5))
         
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        data_log.append({
-            'Time': timestamp,
+        sample = {
+            'Time': datetime.now().strftime("%H:%M:%S"),
             'HR': tele["hr"],
             'SpO2': tele["spo2"],
             'Temp': tele["temp"],
             'RiskProb': res.get("ml", {}).get("risk_prob", 0),
-            'Secure': res.get("secure", False),
+            'Secure': str(res.get("secure", False)),
             'KeyBufLen': res.get("key_buffer_len", 0)
-        })
-        
-        # Keep only last 50 entries
-        if len(data_log) > 50:
-            data_log = data_log[-50:]
-        
-        df = pd.DataFrame(data_log)
-        
-        # Create charts
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=df['Time'], y=df['RiskProb'], name='Risk Prob', mode='lines'))
-        fig.add_trace(go.Scatter(x=df['Time'], y=df['KeyBufLen'], name='Key Buffer', mode='lines', yaxis='y2'))
-        
-        fig.update_layout(
-            title="Live Telemetry Metrics",
-            xaxis=dict(title='Time'),
-            yaxis=dict(title='Risk Probability'),
-            yaxis2=dict(title='Key Buffer Length', overlaying='y', side='right'),
-            hovermode='x unified'
-        )
-        
-        table = html.Table([
-            html.Thead(html.Tr([html.Th(col) for col in df.columns])),
-            html.Tbody([
-                html.Tr([html.Td(df.iloc[i][col]) for col in df.columns])
-                for i in range(max(0, len(df)-10), len(df))
-            ])
-        ], style={'fontSize': '12px'})
-        
-        return table, fig, data_log
+        }
+        return sample, ""
         
     except:
-        return html.Div("Backend error", style={'color': 'red'}), go.Figure(), data_log
+        return dash.no_update, html.Div("Backend error", style={'color': 'red'})
+
+# Telemetry Update (client side: append sample to log, table and chart)
+app.clientside_callback(
+    """
+    function(sample, log) {
+        var no_update = window.dash_clientside.no_update;
+        if (!sample) {
+            return [no_update, no_update, no_update];
+        }
+        log = (log || []).concat([sample]).slice(-%d);
+        var extend = [{x: [[sample.Time], [sample.Time]], y: [[sample.RiskProb], [sample.KeyBufLen]]}, [0, 1], %d];
+        return [log, log.slice(-10), extend];
+    }
+    """ % (TELEMETRY_MAX_POINTS, TELEMETRY_MAX_POINTS),
+    [Output('telemetry-data-store', 'data'),
+     Output('telemetry-table', 'data'),
+     Output('telemetry-chart', 'extendData')],
+    Input('telemetry-sample', 'data'),
+    State('telemetry-data-store', 'data')
+)
 
 # Ingest Telemetry Button
 @app.callback(
@@ -349,9 +362,10 @@ def ingest_telemetry(n_clicks, alt_km):
     if n_clicks == 0:
         return ""
     try:
-        tele = requests.get(f"{API_ROOT}/simtelemetry", timeout=3).json()
+        tele = read_json(requests.get(f"{API_ROOT}/simtelemetry", timeout=3))
         radiation = estimate_radiation(alt_km)
-        res = requests.post(f"{API_ROOT}/ingest", json=tele, params={"radiation": radiation}, timeout=5).json()
+        res = read_json(requests.post(f"{API_ROOT}/ingest", data=orjson.dumps(tele), headers=JSON_HEADERS,
+                                      params={"radiation": radiation}, timeout=5))
         return html.Pre(str(res))
     except:
         return html.Div("Backend error", style={'color': 'red'})
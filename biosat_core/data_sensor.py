@@ -1,8 +1,27 @@
-import time, random
+import time
+import numpy as np
+
+_BATCH = 1024
+_MU = np.array([75.0, 98.0, 36.5], dtype=np.float32)
+_SIGMA = np.array([6.0, 1.2, 0.3], dtype=np.float32)
+_LO = np.array([50.0, 85.0, 34.0], dtype=np.float32)
+_HI = np.array([120.0, 100.0, 40.0], dtype=np.float32)
+
+_rng = np.random.default_rng()
+_buf = np.empty((_BATCH, 3), dtype=np.float32)
+_idx = _BATCH
+
+def _refill():
+    global _idx
+    _buf[:] = _rng.normal(_MU, _SIGMA, size=(_BATCH, 3))
+    np.clip(_buf, _LO, _HI, out=_buf)
+    _idx = 0
 
 def get_demo_telemetry():
+    global _idx
+    if _idx >= _BATCH:
+        _refill()
+    hr, spo2, temp = _buf[_idx].tolist()
+    _idx += 1
     ts = int(time.time()*1000)
-    hr = int(max(50, min(120, 75 + random.gauss(0,6))))
-    spo2 = int(max(85, min(100, 98 + random.gauss(0,1.2))))
-    temp = round(max(34.0, min(40.0, 36.5 + random.gauss(0,0.3))),2)
-    return {"ts": ts, "hr": hr, "spo2": spo2, "temp": temp, "device":"ARD01"}
+    return {"ts": ts, "hr": int(hr), "spo2": int(spo2), "temp": round(temp, 2), "device":"ARD01"}
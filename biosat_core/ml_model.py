@@ -1,8 +1,8 @@
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier
-import joblib, os
+import os
 
-MODEL_PATH = os.path.join(os.path.dirname(__file__), "bio_ml.pkl")
+MODEL_PATH = os.path.join(os.path.dirname(__file__), "bio_ml.npz")
+_MODEL = None
 
 def generate_synthetic_dataset(n=2000, seed=0):
     np.random.seed(seed)
@@ -15,21 +15,58 @@ def generate_synthetic_dataset(n=2000, seed=0):
     return X, y
 
 def train_and_save_model():
+    # sklearn is only needed to (re)train; importing biosat_core must not pay for it
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.tree import DecisionTreeRegressor
     X, y = generate_synthetic_dataset()
-    clf = RandomForestClassifier(n_estimators=80, random_state=0)
-    clf.fit(X, y)
-    joblib.dump(clf, MODEL_PATH)
-    return clf
+    forest = RandomForestClassifier(n_estimators=80, random_state=0)
+    forest.fit(X, y)
+    # Distil the forest into one small tree fitted to its probabilities on
+    # fresh samples, so the leaves keep graded risk instead of 0/1
+    X_distil, _ = generate_synthetic_dataset(n=20000, seed=1)
+    reg = DecisionTreeRegressor(max_leaf_nodes=32, min_samples_leaf=20, random_state=0)
+    reg.fit(X_distil, forest.predict_proba(X_distil)[:,1])
+    tree = reg.tree_
+    model = {
+        "feature": tree.feature.astype(np.intp),
+        "threshold": tree.threshold,
+        "left": tree.children_left.astype(np.intp),
+        "right": tree.children_right.astype(np.intp),
+        "prob": tree.value[:,0,0],
+        "depth": np.array(tree.max_depth),
+    }
+    np.savez(MODEL_PATH, **model)
+    return model
 
 def load_model():
     if os.path.exists(MODEL_PATH):
-        return joblib.load(MODEL_PATH)
+        with np.load(MODEL_PATH) as f:
+            return {k: f[k] for k in f.files}
     else:
         return train_and_save_model()
 
+def _get_model():
+    global _MODEL
+    if _MODEL is None:
+        _MODEL = load_model()
+    return _MODEL
+
+def _tree_proba(model, X):
+    rows = np.arange(len(X))
+    node = np.zeros(len(X), dtype=np.intp)
+    for _ in range(int(model["depth"])):
+        feat = model["feature"][node]
+        leaf = feat < 0
+        go_left = X[rows, np.where(leaf, 0, feat)] <= model["threshold"][node]
+        child = np.where(go_left, model["left"][node], model["right"][node])
+        node = np.where(leaf, node, child)
+    return model["prob"][node]
+
+def predict_risk_batch(X):
+    model = _get_model()
+    probs = _tree_proba(model, np.asarray(X, dtype=np.float32))
+    return [{"risk_prob": float(p), "risk_label": int(p > 0.5)} for p in probs]
+
 def predict_risk(hr, spo2, temp, radiation):
-    model = load_model()
-    X = np.array([[hr, spo2, temp, radiation]])
-    prob = float(model.predict_proba(X)[0,1])
-    label = int(prob > 0.5)
-    return {"risk_prob": prob, "risk_label": label}
+    X = np.array([[hr, spo2, temp, radiation]], dtype=np.float32)
+    return predict_risk_batch(X)[0]
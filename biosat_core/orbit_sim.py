@@ -1,4 +1,6 @@
 import numpy as np
+from functools import lru_cache
+from math import radians, degrees, sin, cos, sqrt, pi
 
 R_EARTH_KM = 6371.0
 MU = 398600.4418 # km^3/s^2
@@ -12,26 +14,22 @@ class ConstellationSimulator:
         np.random.seed(42)
         self.e_list = np.random.uniform(0.01, 0.05, count)
         self.theta_offset = np.random.uniform(0, 2 * np.pi, count)
+        self._cos_inc = np.cos(np.deg2rad(inc_deg))
 
     def get_positions(self, current_phase):
-        """Calculates the current 3D position of all constellation satellites."""
-        positions = []
-        for i in range(self.count):
-            theta = 2 * np.pi * (current_phase + self.theta_offset[i]) % (2 * np.pi)
-            e = self.e_list[i]
-            
-            r = (self.a * (1 - e**2)) / (1 + e * np.cos(theta))
-            
-            x_orbit = r * np.cos(theta)
-            y_orbit = r * np.sin(theta)
-            
-
-            x_inclined = x_orbit * np.cos(np.deg2rad(self.inc_deg))
-            y_inclined = y_orbit
-            
-            positions.append({'r': r, 'x': x_inclined, 'y': y_inclined})
-
-        return positions
+        """Calculates the current 3D position of all constellation satellites as arrays."""
+        theta = 2 * np.pi * (current_phase + self.theta_offset) % (2 * np.pi)
+        e = self.e_list
+
+        r = (self.a * (1 - e**2)) / (1 + e * np.cos(theta))
+
+        x_orbit = r * np.cos(theta)
+        y_orbit = r * np.sin(theta)
+
+        x_inclined = x_orbit * self._cos_inc
+        y_inclined = y_orbit
+
+        return {'r': r, 'x': x_inclined, 'y': y_inclined}
 
 class OrbitSimulator:
     def __init__(self, alt_km=500.0, inc_deg=51.6):
@@ -40,26 +38,23 @@ class OrbitSimulator:
 
     def orbital_period_min(self):
         a = R_EARTH_KM + self.alt_km
-        T = 2 * np.pi * np.sqrt(a**3 / MU) # seconds
-        return float(T/60.0)
+        T = 2 * pi * sqrt(a**3 / MU) # seconds
+        return T/60.0
 
     def subpoint(self, phase=0.0):
-        theta = 2 * np.pi * (phase % 1.0)
-        lat = (self.inc_deg) * np.sin(theta)
-        lon = (np.degrees(theta) + 180) % 360 - 180
+        theta = 2 * pi * (phase % 1.0)
+        lat = (self.inc_deg) * sin(theta)
+        lon = (degrees(theta) + 180) % 360 - 180
         return float(lat), float(lon)
 
 def sat_ground_distance_km(alt_km, gs_lat_deg=0.0, gs_lon_deg=0.0, sat_lat_deg=0.0, sat_lon_deg=0.0):
-    def sph_to_cart(lat, lon, r):
-        lr = np.deg2rad(lat); lo = np.deg2rad(lon)
-        x = r * np.cos(lr) * np.cos(lo)
-        y = r * np.cos(lr) * np.sin(lo)
-        z = r * np.sin(lr)
-        return np.array([x,y,z])
     sat_r = R_EARTH_KM + alt_km
-    sat_cart = sph_to_cart(sat_lat_deg, sat_lon_deg, sat_r)
-    gs_cart = sph_to_cart(gs_lat_deg, gs_lon_deg, R_EARTH_KM)
-    return float(np.linalg.norm(sat_cart - gs_cart))
+    slat, slon = radians(sat_lat_deg), radians(sat_lon_deg)
+    glat, glon = radians(gs_lat_deg), radians(gs_lon_deg)
+    dx = sat_r * cos(slat) * cos(slon) - R_EARTH_KM * cos(glat) * cos(glon)
+    dy = sat_r * cos(slat) * sin(slon) - R_EARTH_KM * cos(glat) * sin(glon)
+    dz = sat_r * sin(slat) - R_EARTH_KM * sin(glat)
+    return sqrt(dx*dx + dy*dy + dz*dz)
 
 def estimate_radiation(alt_km):
     return float(np.clip((alt_km - 200.0) / 800.0, 0.0, 1.0))
@@ -73,29 +68,37 @@ def calculate_orbit(a: float, e: float) -> dict:
         if e < 0: e = 0.0
         if e >= 1: e = 0.99 
         
-    theta_path = np.linspace(0, 2 * np.pi, 500)
-    r_path = (a * (1 - e**2)) / (1 + e * np.cos(theta_path))
-    x_path = r_path * np.cos(theta_path)
-    y_path = r_path * np.sin(theta_path)
-
-    num_frames = 1000
-    phase_anim = np.linspace(0, 1.0, num_frames, endpoint=False)
-    theta_anim = 2 * np.pi * phase_anim
-    
-    r_anim = (a * (1 - e**2)) / (1 + e * np.cos(theta_anim))
-    x_anim = r_anim * np.cos(theta_anim)
-    y_anim = r_anim * np.sin(theta_anim)
-    
-
-    max_r = np.max(r_path)
+    n_path, num_frames = 500, 1000
+    theta_path = np.linspace(0, 2 * np.pi, n_path)
+    theta_anim = 2 * np.pi * np.linspace(0, 1.0, num_frames, endpoint=False)
+    theta = np.concatenate([theta_path, theta_anim])
+
+    # One trig sweep over path + animation grids, downcast for transport
+    cos_t = np.cos(theta)
+    r = (a * (1 - e**2)) / (1 + e * cos_t)
+    x = (r * cos_t).astype(np.float32)
+    y = (r * np.sin(theta)).astype(np.float32)
+
+    x_path, x_anim = x[:n_path], x[n_path:]
+    y_path, y_anim = y[:n_path], y[n_path:]
+
+    max_r = np.max(r[:n_path])
 
     return {
-        "x_path": x_path.tolist(),
-        "y_path": y_path.tolist(),
-        "x_anim": x_anim.tolist(),
-        "y_anim": y_anim.tolist(),
+        "x_path": x_path,
+        "y_path": y_path,
+        "x_anim": x_anim,
+        "y_anim": y_anim,
         "max_radius": float(max_r),
         "semi_major_axis": a,
         "eccentricity": e,
         "earth_radius": R_EARTH_KM 
     }
+
+@lru_cache(maxsize=256)
+def calculate_orbit_cached(a: float, e: float) -> dict:
+    """
+    Memoized calculate_orbit keyed on (a, e). The returned dict is shared
+    between callers and must be treated as read-only.
+    """
+    return calculate_orbit(a, e)
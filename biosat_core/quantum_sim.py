@@ -1,49 +1,77 @@
-import random, numpy as np
-from math import log2
+import numpy as np
+from math import log2, exp
 
-def random_bits(n): return [random.randint(0,1) for _ in range(n)]
-def random_bases(n): return [random.choice(['Z','X']) for _ in range(n)]
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+_RNG = np.random.default_rng()
 
 def bin_entropy(p):
     if p <= 0 or p >= 1: return 0.0
-    return -p*np.log2(p) - (1-p)*np.log2(1-p)
+    return -p*log2(p) - (1-p)*log2(1-p)
 
-def transmit_bb84(n_photons, trans_prob, error_prob):
-    a_bits = random_bits(n_photons)
-    a_bases = random_bases(n_photons)
-    arrives = np.random.rand(n_photons) < trans_prob
-    b_bases = random_bases(n_photons)
-    b_results = [None]*n_photons
+def _bb84_numpy(n_photons, trans_prob, error_prob):
+    a_bits = _RNG.integers(0, 2, n_photons, dtype=np.uint8)
+    a_bases = _RNG.integers(0, 2, n_photons, dtype=np.uint8)
+    arrives = _RNG.random(n_photons) < trans_prob
+    b_bases = _RNG.integers(0, 2, n_photons, dtype=np.uint8)
+    match = a_bases == b_bases
+    flip = (_RNG.random(n_photons) < error_prob).astype(np.uint8)
+    b_results = np.where(match, a_bits ^ flip, _RNG.integers(0, 2, n_photons, dtype=np.uint8))
+    return a_bits, b_results, arrives, match
+
+def _bb84_kernel(n_photons, trans_prob, error_prob, seed):
+    # Plain-Python photon loop, compiled by Numba (JIT here, AOT in _compiled.py)
+    np.random.seed(seed)
+    a_bits = np.empty(n_photons, np.uint8)
+    b_bits = np.empty(n_photons, np.uint8)
+    arrives = np.empty(n_photons, np.bool_)
+    match = np.empty(n_photons, np.bool_)
     for i in range(n_photons):
-        if not arrives[i]:
-            b_results[i] = None; continue
-        if a_bases[i] == b_bases[i]:
-            bit = a_bits[i]
-            if random.random() < error_prob:
+        bit = np.random.randint(0, 2)
+        a_bits[i] = bit
+        arrives[i] = np.random.random() < trans_prob
+        match[i] = np.random.randint(0, 2) == np.random.randint(0, 2)
+        if match[i]:
+            if np.random.random() < error_prob:
                 bit ^= 1
-            b_results[i] = bit
+            b_bits[i] = bit
         else:
-            b_results[i] = random.randint(0,1)
-    sifted_indices = [i for i in range(n_photons) if arrives[i] and a_bases[i]==b_bases[i]]
-    a_sift = [a_bits[i] for i in sifted_indices]
-    b_sift = [b_results[i] for i in sifted_indices]
-    sample_size = max(1, int(0.2 * len(a_sift))) if a_sift else 0
+            b_bits[i] = np.random.randint(0, 2)
+    return a_bits, b_bits, arrives, match
+
+try:
+    from ._biosat_native import bb84_core as _bb84_core
+except ImportError:
+    _bb84_core = njit(cache=True)(_bb84_kernel) if njit is not None else None
+
+def transmit_bb84(n_photons, trans_prob, error_prob):
+    if _bb84_core is not None:
+        seed = int(_RNG.integers(0, 2**31 - 1))
+        a_bits, b_results, arrives, match = _bb84_core(n_photons, float(trans_prob), float(error_prob), seed)
+    else:
+        a_bits, b_results, arrives, match = _bb84_numpy(n_photons, trans_prob, error_prob)
+    mask = arrives & match
+    a_sift = a_bits[mask]
+    b_sift = b_results[mask]
+    sample_size = max(1, int(0.2 * len(a_sift))) if len(a_sift) else 0
     if sample_size > 0 and len(a_sift) >= sample_size:
-        sample_idx = random.sample(range(len(a_sift)), sample_size)
-        errors = sum(1 for k in sample_idx if a_sift[k] != b_sift[k])
+        sample_idx = _RNG.choice(len(a_sift), sample_size, replace=False)
+        errors = int(np.count_nonzero(a_sift[sample_idx] != b_sift[sample_idx]))
         qber = errors / sample_size
     else:
         qber = 0.0
     leak_ec = 0.1
     R_secure = max(0, int(len(a_sift) * max(0.0, 1 - bin_entropy(qber) - leak_ec)))
-    sifted_key = ''.join(str(b) for b in b_sift)
-    demo_key = sifted_key[:R_secure]
-    return {"n_sent": n_photons, "n_sifted": len(a_sift), "qber": qber, "R_secure_bits": R_secure, "sifted_key": demo_key}
+    sifted_bytes = np.packbits(b_sift[:R_secure]).tobytes()
+    return {"n_sent": n_photons, "n_sifted": len(a_sift), "qber": qber, "R_secure_bits": R_secure, "sifted_bytes": sifted_bytes}
 
 def trans_prob_from_distance(d_km, loss_coeff=0.0012):
-    return float(np.exp(-loss_coeff * d_km))
+    return exp(-loss_coeff * d_km)
 
 def entanglement_fidelity(trans_prob, depolar_prob=0.05):
     survive = trans_prob**2
     fidelity = survive*(1-depolar_prob) + (1-survive)*0.5
-    return float(np.clip(fidelity, 0.0, 1.0))
+    return float(max(0.0, min(1.0, fidelity)))
@@ -1,20 +1,30 @@
 import streamlit as st
-import requests, time
+import requests, time, io, uuid
+from requests.adapters import HTTPAdapter
+import asyncio, threading
+from collections import deque
+import aiohttp
+import orjson
 import pandas as pd
 import numpy as np
-import altair as alt
+import plotly.graph_objects as go
 from datetime import datetime
 from biosat_core import OrbitSimulator, estimate_radiation 
 
 API_ROOT = "http://localhost:8000"
+NPZ_MEDIA_TYPE = "application/x-npz"
+JSON_HEADERS = {"Content-Type": "application/json"}
 
-st.set_page_config(
-    page_title="BioSat-Q+ Mission Control", 
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+TELE_CAPACITY = 100
+TELE_BATCH = 4
+TELE_FLUSH_S = 5.0
+POLL_BACKOFF_MAX = 10.0
+STATUS_REFRESH_S = 2.0
+ORBIT_FRAME_MS = 50
+SESSION_STORE_MAX = 64
+TELE_COLUMNS = ["HR", "SpO2", "Temp", "RiskProb", "Secure", "KeyBufLen"]
 
-st.markdown("""
+APP_CSS = """
     <style>
     .main {
         background: linear-gradient(135deg, #f5f7fa 0%, #e8eef5 100%);
@@ -107,16 +117,162 @@ st.markdown("""
         border-top: 1px solid #e2e8f0;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+st.set_page_config(
+    page_title="BioSat-Q+ Mission Control", 
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+@st.cache_resource
+def http() -> requests.Session:
+    """Pooled session so the synchronous sidebar calls reuse their TCP connection."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+@st.cache_resource
+def get_event_loop():
+    """Background event loop shared by all reruns so the aiohttp session outlives each one."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+def read_json(response):
+    return orjson.loads(response.content)
+
+def submit_async(coro):
+    """Schedules coro on the background loop and returns a concurrent.futures.Future."""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+
+def run_async(coro):
+    return submit_async(coro).result()
+
+@st.cache_resource
+def get_session():
+    async def make_session():
+        return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=16, keepalive_timeout=30))
+    return run_async(make_session())
+
+async def get_json(session, path, timeout=3):
+    async with session.get(f"{API_ROOT}{path}", timeout=aiohttp.ClientTimeout(total=timeout)) as r:
+        return await r.json(loads=orjson.loads)
+
+async def ingest_once(session, radiation):
+    tele = await get_json(session, "/simtelemetry")
+    async with session.post(f"{API_ROOT}/ingest", data=orjson.dumps(tele), headers=JSON_HEADERS,
+            params={"radiation": radiation},
+            timeout=aiohttp.ClientTimeout(total=5)) as r:
+        return tele, await r.json(loads=orjson.loads)
+
+async def ingest_batch(session, radiation, samples):
+    """Ingests buffered samples in one round-trip instead of one POST each."""
+    async with session.post(f"{API_ROOT}/ingest_batch", data=orjson.dumps(samples), headers=JSON_HEADERS,
+            params={"radiation": radiation},
+            timeout=aiohttp.ClientTimeout(total=5)) as r:
+        r.raise_for_status()
+        return await r.json(loads=orjson.loads)
 
-if 'telemetry_data' not in st.session_state:
-    st.session_state['telemetry_data'] = []
-if 'orbit_frame' not in st.session_state:
-    st.session_state['orbit_frame'] = 0
-if 'orbit_playing' not in st.session_state:
-    st.session_state['orbit_playing'] = False
+@st.cache_data(ttl=STATUS_REFRESH_S)
+def fetch_status():
+    return run_async(get_json(get_session(), "/status"))
+
+@st.cache_data(max_entries=64, ttl=3600, show_spinner=False)
+def run_orbit(a, e):
+    """Orbit arrays for (a, e). Failures raise, so they are never cached."""
+    response = http().post(f"{API_ROOT}/simulate_orbit",
+        data=orjson.dumps({"semi_major_axis": a, "eccentricity": e}),
+        headers={"Accept": f"{NPZ_MEDIA_TYPE}, application/json", **JSON_HEADERS}, timeout=10)
+    if not response.headers.get("content-type", "").startswith(NPZ_MEDIA_TYPE):
+        raise ValueError(read_json(response).get("message", "Calculation failed"))
+    with np.load(io.BytesIO(response.content)) as f:
+        return {k: f[k][()] for k in f.files}
+
+@st.cache_resource
+def session_store():
+    """Per-browser snapshots keyed by the ?sid= query param, so a reconnect can restore them."""
+    return {}
+
+def save_snapshot(sid, **state):
+    store = session_store()
+    snap = store.pop(sid, {})
+    snap.update(state)
+    store[sid] = snap
+    while len(store) > SESSION_STORE_MAX:
+        store.pop(next(iter(store)), None)
+
+@st.cache_data(ttl=30.0)
+def radiation_for(alt_km):
+    return estimate_radiation(alt_km)
+
+def orbit_animate_args(frame_ms):
+    return {"frame": {"duration": frame_ms, "redraw": False}, "transition": {"duration": 0},
+            "mode": "immediate", "fromcurrent": True}
+
+@st.cache_resource(max_entries=64)
+def orbit_figure(a, e, limit, _data):
+    """
+    Orbit figure carrying every animation frame. Play/Pause/Reset are Plotly
+    animate buttons, so playback runs in the browser with no script reruns.
+    """
+    # 0.1 km is far below a pixel at this scale and keeps the frame JSON short
+    x_anim, y_anim = (np.round(_data[k].astype(np.float64), 1).tolist() for k in ('x_anim', 'y_anim'))
+    frames = [{"name": str(i), "traces": [2], "data": [{"x": [x], "y": [y]}]}
+              for i, (x, y) in enumerate(zip(x_anim, y_anim))]
+    axis = dict(range=[-limit, limit], zeroline=False, gridcolor='#e2e8f0')
+    return go.Figure(
+        data=[
+            go.Scatter(x=_data['x_path'], y=_data['y_path'], mode='markers', name='Orbit Path',
+                       marker=dict(size=3, color='#cbd5e0')),
+            go.Scatter(x=[0], y=[0], mode='markers', name='Earth',
+                       marker=dict(size=24, color='#4299e1')),
+            go.Scatter(x=x_anim[:1], y=y_anim[:1], mode='markers', name='Satellite',
+                       marker=dict(size=14, color='#f56565')),
+        ],
+        layout=dict(
+            width=500, height=500, margin=dict(l=40, r=20, t=20, b=80),
+            xaxis=dict(title='X (km)', **axis), yaxis=dict(title='Y (km)', scaleanchor='x', **axis),
+            plot_bgcolor='white', legend=dict(orientation='h', y=1.08),
+            updatemenus=[dict(type='buttons', direction='left', showactive=False,
+                              x=0, y=-0.12, xanchor='left', yanchor='top', buttons=[
+                dict(label='▶️ Play', method='animate', args=[None, orbit_animate_args(ORBIT_FRAME_MS)]),
+                dict(label='⏸️ Pause', method='animate', args=[[None], orbit_animate_args(0)]),
+                dict(label='🔄 Reset', method='animate', args=[['0'], orbit_animate_args(0)]),
+            ])],
+        ),
+        frames=frames,
+    )
+
+# Full runs only: fragment reruns (polling, orbit playback) never re-send the stylesheet
+st.markdown(APP_CSS, unsafe_allow_html=True)
+
+# Streamlit's own session id changes on reconnect; the URL's sid survives a reload
+session_id = st.query_params.get("sid")
+if session_id is None:
+    session_id = st.query_params["sid"] = uuid.uuid4().hex[:12]
+
+if 'tele_buf' not in st.session_state:
+    snap = session_store().get(session_id, {})
+    st.session_state['tele_buf'] = snap['tele_buf'].copy() if 'tele_buf' in snap else np.zeros((TELE_CAPACITY, len(TELE_COLUMNS)), np.float32)
+    st.session_state['tele_ts'] = deque(snap.get('tele_ts', ()), maxlen=TELE_CAPACITY)
+    st.session_state['tele_head'] = snap.get('tele_head', 0)
+    st.session_state['tele_count'] = snap.get('tele_count', 0)
+    # Total rows ever written; unlike (count, head) it changes on every flush
+    st.session_state['tele_written'] = 0
+    # Polled samples waiting for the next /ingest_batch flush
+    st.session_state['pending_tele'] = deque(maxlen=TELE_CAPACITY)
+    st.session_state['pending_since'] = 0.0
+    if 'orbit_data' in snap:
+        st.session_state['orbit_data'] = snap['orbit_data']
+        st.session_state['orbit_calculated'] = True
 if 'last_telemetry_update' not in st.session_state:
     st.session_state['last_telemetry_update'] = 0
+if 'poll_backoff' not in st.session_state:
+    st.session_state['poll_backoff'] = 0.0
+    st.session_state['last_tele_hash'] = None
 
 
 st.markdown("<h1>🛰️ BioSat-Q+ Mission Control</h1>", unsafe_allow_html=True)
@@ -135,11 +291,12 @@ error_prob = st.sidebar.slider("Measurement error prob", 0.0, 0.2, 0.02)
 
 if st.sidebar.button("🔑 Run QKD Session"):
     try:
-        r = requests.post(f"{API_ROOT}/qkd/run_session", params={
+        r = read_json(http().post(f"{API_ROOT}/qkd/run_session", params={
             "n_photons": n_photons, "alt_km": alt_km, "sat_lat": sat_lat, 
             "sat_lon": sat_lon, "error_prob": error_prob
-        }, timeout=10).json()
+        }, timeout=10))
         st.sidebar.success(f"Added {r.get('added_bits',0)} bits — buffer {r.get('key_buffer_len')}")
+        fetch_status.clear()
     except:
         st.sidebar.error("Backend unreachable")
 
@@ -149,52 +306,75 @@ st.sidebar.subheader("🌍 Orbit Simulation")
 a = st.sidebar.slider("Semi-Major Axis (km)", 6700.0, 42000.0, 7000.0, step=100.0)
 e = st.sidebar.slider("Eccentricity", 0.0, 0.9, 0.3, step=0.01)
 
+force_orbit = st.sidebar.checkbox("Force refresh", value=False)
+
 if st.sidebar.button("🚀 Run Orbit Simulation"):
+    if force_orbit:
+        run_orbit.clear()
     with st.spinner('Calculating orbit...'):
         try:
-            response = requests.post(f"{API_ROOT}/simulate_orbit",
-                json={"semi_major_axis": a, "eccentricity": e})
-            
-            if response.status_code == 200 and response.json().get("status") == "success":
-                orbit_data = response.json()["data"]
-                st.session_state['orbit_data'] = orbit_data
-                st.session_state['orbit_calculated'] = True
-                st.session_state['orbit_frame'] = 0
-                st.session_state['orbit_playing'] = True
-                st.sidebar.success("Orbit calculated!")
-            else:
-                st.sidebar.error("Calculation failed")
-        except:
+            st.session_state['orbit_data'] = run_orbit(a, e)
+            st.session_state['orbit_calculated'] = True
+            save_snapshot(session_id, orbit_data=st.session_state['orbit_data'])
+            st.sidebar.success("Orbit calculated!")
+        except requests.RequestException:
             st.sidebar.error("Backend unreachable")
+        except ValueError:
+            st.sidebar.error("Calculation failed")
 
 col1, col2, col3 = st.columns([0.25, 1, 0.5], gap="small")
 
 with col1:
     st.markdown("### 📊 System Status")
+    status_slot = st.container()
+    if st.button("🔄 Refresh Status"):
+        fetch_status.clear()
+    ingest_clicked = st.button("📡 Ingest Telemetry")
+    ingest_slot = st.container()
+
+with col3:
+    st.markdown("### 📡 Live Telemetry")
     
+    col_a, col_b = st.columns([2, 1])
+    with col_a:
+        run_live = st.checkbox("Auto-poll telemetry", value=False)
+    with col_b:
+        poll_interval = st.slider("Interval", 1, 5, 1, label_visibility="collapsed")
+
+# Refreshes on its own timer so the key buffer stays live while only the telemetry fragment reruns
+@st.fragment(run_every=STATUS_REFRESH_S)
+def status_panel():
     try:
-        status = requests.get(f"{API_ROOT}/status", timeout=3).json()
-        st.success("🟢 Backend Online")
-    except:
+        status = fetch_status()
+    except Exception:
         status = {"key_buffer_len": 0, "last_qkd": {}}
         st.warning("🔴 Backend Offline")
+    else:
+        st.success("🟢 Backend Online")
     
     st.metric("Key Buffer", f"{status.get('key_buffer_len', 0)} bits")
     
     with st.expander("Last QKD Session"):
         st.json(status.get("last_qkd", {}))
-    
-    if st.button("📡 Ingest Telemetry"):
-        try:
-            tele = requests.get(f"{API_ROOT}/simtelemetry", timeout=3).json()
-            radiation = estimate_radiation(alt_km)
-            res = requests.post(f"{API_ROOT}/ingest", json=tele, 
-                params={"radiation": radiation}, timeout=5).json()
+
+# The manual ingest is in flight while the status request runs
+ingest_future = submit_async(ingest_once(get_session(), radiation_for(alt_km))) if ingest_clicked else None
+with status_slot:
+    status_panel()
+if ingest_future is not None:
+    try:
+        ingest_res = ingest_future.result()
+    except Exception as e:
+        ingest_res = e
+
+if ingest_clicked:
+    with ingest_slot:
+        if isinstance(ingest_res, Exception):
+            st.error("Ingest failed")
+        else:
             st.success("Telemetry ingested")
             with st.expander("Response"):
-                st.json(res)
-        except:
-            st.error("Ingest failed")
+                st.json(ingest_res[1])
 
 with col2:
     st.markdown("### 🌌 Orbital Trajectory")
@@ -202,163 +382,115 @@ with col2:
         data = st.session_state['orbit_data']
         max_r = data['max_radius']
         limit = max_r * 1.1
-        current_frame = st.session_state.get('orbit_frame', 0)
+        n_frames = data['x_anim'].shape[0]
         
-        path_df = pd.DataFrame({
-            'x': data['x_path'],
-            'y': data['y_path'],
-            'type': 'Orbit Path'
-        })
-        
-        earth_df = pd.DataFrame({'x': [0], 'y': [0], 'type': 'Earth'})
-        
-        if current_frame < len(data['x_anim']):
-            satellite_df = pd.DataFrame({
-                'x': [data['x_anim'][current_frame]],
-                'y': [data['y_anim'][current_frame]],
-                'type': 'Satellite'
-            })
-        else:
-            st.session_state['orbit_frame'] = 0
-            st.session_state['orbit_playing'] = False
-            satellite_df = pd.DataFrame({
-                'x': [data['x_anim'][0]],
-                'y': [data['y_anim'][0]],
-                'type': 'Satellite'
-            })
-        
-        frame_df = pd.concat([path_df, earth_df, satellite_df], ignore_index=True)
-        
-        chart = alt.Chart(frame_df).mark_circle().encode(
-            x=alt.X('x:Q', scale=alt.Scale(domain=[-limit, limit]), 
-                axis=alt.Axis(title='X (km)')),
-            y=alt.Y('y:Q', scale=alt.Scale(domain=[-limit, limit]), 
-                axis=alt.Axis(title='Y (km)')),
-            color=alt.Color('type:N', scale=alt.Scale(
-                domain=['Orbit Path', 'Earth', 'Satellite'],
-                range=['#cbd5e0', '#4299e1', '#f56565']
-            )),
-            size=alt.Size('type:N', scale=alt.Scale(
-                domain=['Orbit Path', 'Earth', 'Satellite'],
-                range=[3, 400, 200]
-            ), legend=None),
-            tooltip=['type:N', 'x:Q', 'y:Q']
-        ).properties(
-            width=500,
-            height=500
-        )
-        
-        st.altair_chart(chart, use_container_width=False)
-        
-        st.markdown(f"<p class='caption'>a={data['semi_major_axis']} km, e={data['eccentricity']} | Frame {current_frame + 1}/{len(data['x_anim'])}</p>", unsafe_allow_html=True)
-        
-
-        col_a, col_b, col_c = st.columns(3)
-        with col_a:
-            if st.button("▶️ Play"):
-                st.session_state['orbit_playing'] = True
-                st.rerun()
-        with col_b:
-            if st.button("⏸️ Pause"):
-                st.session_state['orbit_playing'] = False
-                st.rerun()
-        with col_c:
-            if st.button("🔄 Reset"):
-                st.session_state['orbit_frame'] = 0
-                st.session_state['orbit_playing'] = False
-                st.rerun()
-        
-        if st.session_state.get('orbit_playing', False):
-            st.session_state['orbit_frame'] = (current_frame + 1) % len(data['x_anim'])
+        fig = orbit_figure(data['semi_major_axis'], data['eccentricity'], limit, data)
+        st.plotly_chart(fig, use_container_width=False, config={'displayModeBar': False})
+        st.markdown(f"<p class='caption'>a={data['semi_major_axis']} km, e={data['eccentricity']} | {n_frames} frames · press ▶️ Play to run one orbit</p>", unsafe_allow_html=True)
     else:
         st.info("Run orbit simulation in sidebar to visualize")
 
 with col3:
-    st.markdown("### 📡 Live Telemetry")
-    
-    col_a, col_b = st.columns([2, 1])
-    with col_a:
-        run_live = st.checkbox("Auto-poll telemetry", value=False)
-    with col_b:
-        poll_interval = st.slider("Interval", 1, 5, 1, label_visibility="collapsed")
-    
-    data_log = st.session_state.get('telemetry_data', [])
-    current_time = time.time()
-    should_update = run_live and (current_time - st.session_state['last_telemetry_update'] >= poll_interval)
+    # Polling ticks rerun only this fragment; the rest of the page renders once
+    @st.fragment(run_every=poll_interval if run_live else None)
+    def telemetry_panel():
+        current_time = time.time()
+        # Effective interval backs off while telemetry is unchanged (see the poll handling below)
+        poll_every = max(poll_interval, st.session_state['poll_backoff'])
+        should_update = run_live and (current_time - st.session_state['last_telemetry_update'] >= poll_every)
+        if should_update:
+            try:
+                tele = run_async(get_json(get_session(), "/simtelemetry"))
+            except Exception:
+                tele = None
+                st.error("Backend error")
+            if tele is not None:
+                pending = st.session_state['pending_tele']
+                if not pending:
+                    st.session_state['pending_since'] = current_time
+                pending.append(tele)
+                st.session_state['last_telemetry_update'] = current_time
+                
+                tele_hash = hash((tele["hr"], tele["spo2"], tele["temp"]))
+                # Vitals only: risk sits on a handful of leaf values and repeats even while vitals move
+                if tele_hash == st.session_state['last_tele_hash']:
+                    st.session_state['poll_backoff'] = min(poll_every * 2, POLL_BACKOFF_MAX)
+                else:
+                    st.session_state['poll_backoff'] = poll_interval
+                st.session_state['last_tele_hash'] = tele_hash
+        
+        # One sample per tick; ingest them TELE_BATCH at a time (or once the oldest is TELE_FLUSH_S old)
+        pending = st.session_state['pending_tele']
+        if pending and (len(pending) >= TELE_BATCH or not run_live
+                        or current_time - st.session_state['pending_since'] >= TELE_FLUSH_S):
+            try:
+                results = run_async(ingest_batch(get_session(), radiation_for(alt_km), list(pending)))
+            except Exception:
+                st.error("Backend error")
+            else:
+                buf = st.session_state['tele_buf']
+                head = st.session_state['tele_head']
+                for tele, res in zip(pending, results):
+                    buf[head] = (
+                        tele["hr"], 
+                        tele["spo2"], 
+                        tele["temp"], 
+                        res.get("ml", {}).get("risk_prob", 0), 
+                        res.get("secure", False), 
+                        res.get("key_buffer_len", 0)
+                    )
+                    st.session_state['tele_ts'].append(datetime.fromtimestamp(tele["ts"] / 1000).strftime("%H:%M:%S"))
+                    head = (head + 1) % TELE_CAPACITY
+                st.session_state['tele_head'] = head
+                st.session_state['tele_count'] = min(st.session_state['tele_count'] + len(results), TELE_CAPACITY)
+                st.session_state['tele_written'] += len(results)
+                pending.clear()
+                save_snapshot(session_id, tele_buf=buf.copy(), tele_ts=list(st.session_state['tele_ts']),
+                              tele_head=head, tele_count=st.session_state['tele_count'])
     
-    if should_update:
-        try:
-            tele = requests.get(f"{API_ROOT}/simtelemetry", timeout=3).json()
-            radiation = estimate_radiation(alt_km)
-            res = requests.post(f"{API_ROOT}/ingest", json=tele, 
-                params={"radiation": radiation}, timeout=5).json()
-            
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            data_log.append([
-                timestamp, 
-                tele["hr"], 
-                tele["spo2"], 
-                tele["temp"], 
-                res.get("ml", {}).get("risk_prob", 0), 
-                res.get("secure", False), 
-                res.get("key_buffer_len", 0)
-            ])
+        count = st.session_state['tele_count']
+        if count:
+            # Rebuild the frame and metrics only after a flush has written new rows
+            render_key = st.session_state['tele_written']
+            rendered = st.session_state.get('tele_rendered')
+            if rendered is None or rendered[0] != render_key:
+                buf = st.session_state['tele_buf']
+                head = st.session_state['tele_head']
+                # Oldest-first view of the ring buffer (no copy until it has wrapped)
+                view = buf[:count] if count < TELE_CAPACITY else np.concatenate([buf[head:], buf[:head]])
+                df = pd.DataFrame(view, columns=TELE_COLUMNS, copy=False)
+                df.index = pd.Index(list(st.session_state['tele_ts']), name="Time")
+                # Row order doesn't matter for the means, so reduce the filled slots in place
+                hr_avg, spo2_avg = buf[:count, :2].mean(axis=0)
+                latest_risk = buf[(head - 1) % TELE_CAPACITY, 3]
+                rendered = st.session_state['tele_rendered'] = (render_key, df, hr_avg, spo2_avg, latest_risk)
+            _, df, hr_avg, spo2_avg, latest_risk = rendered
             
-            if len(data_log) > 100:
-                data_log = data_log[-100:]
-            
-            st.session_state['telemetry_data'] = data_log
-            st.session_state['last_telemetry_update'] = current_time
-        except:
-            st.error("Backend error")
-    
-    if data_log:
-        df = pd.DataFrame(data_log, 
-            columns=["Time", "HR", "SpO2", "Temp", "RiskProb", "Secure", "KeyBufLen"]).set_index("Time")
-        
-        col_a, col_b, col_c = st.columns(3)
-        with col_a:
-            st.metric("💓 Avg HR", f"{df['HR'].mean():.0f} bpm")
-        with col_b:
-            st.metric("🫁 SpO2", f"{df['SpO2'].mean():.1f}%")
-        with col_c:
-            latest_risk = df['RiskProb'].iloc[-1]
-            st.metric("⚠️ Risk", f"{latest_risk:.1%}")
+            col_a, col_b, col_c = st.columns(3)
+            with col_a:
+                st.metric("💓 Avg HR", f"{hr_avg:.0f} bpm")
+            with col_b:
+                st.metric("🫁 SpO2", f"{spo2_avg:.1f}%")
+            with col_c:
+                st.metric("⚠️ Risk", f"{latest_risk:.1%}")
         
-        tab1, tab2 = st.tabs(["📊 Chart", "📋 Table"])
-        
-        with tab1:
-            chart_data = df[["RiskProb", "KeyBufLen"]].fillna(0)
-            melted = chart_data.reset_index().melt('Time', var_name='Metric', value_name='Value')
-            
-            chart = alt.Chart(melted).mark_line(point=True, strokeWidth=2).encode(
-                x=alt.X('Time:N', axis=alt.Axis(labelAngle=-45)),
-                y=alt.Y('Value:Q'),
-                color=alt.Color('Metric:N', scale=alt.Scale(
-                    domain=['RiskProb', 'KeyBufLen'],
-                    range=['#f56565', '#48bb78']
-                )),
-                tooltip=['Time', 'Metric', 'Value']
-            ).properties(height=300)
-            
-            st.altair_chart(chart, use_container_width=True)
+            # Only the selected view is built and serialized on each tick
+            view_choice = st.radio("View", ["📊 Chart", "📋 Table"], horizontal=True,
+                                   key="tele_view", label_visibility="collapsed")
         
-        with tab2:
-            st.dataframe(df.tail(10), use_container_width=True)
-    else:
-        st.info("Enable auto-poll to stream telemetry")
-
+            if view_choice == "📊 Chart":
+                st.line_chart(df[["RiskProb", "KeyBufLen"]], color=["#f56565", "#48bb78"],
+                              height=300, use_container_width=True)
+            else:
+                table = df.tail(10).astype({"HR": int, "SpO2": int, "Temp": float, "Secure": bool, "KeyBufLen": int})
+                st.dataframe(table.round({"Temp": 2}), use_container_width=True)
+        elif pending:
+            st.info(f"Buffering telemetry ({len(pending)}/{TELE_BATCH} samples)")
+        else:
+            st.info("Enable auto-poll to stream telemetry")
 
-needs_rerun = False
-if st.session_state.get('orbit_playing', False):
-    needs_rerun = True
-    time.sleep(0.05)
-elif run_live:
-    needs_rerun = True
-    time.sleep(0.5)
+    telemetry_panel()
 
-if needs_rerun:
-    st.rerun()
 
 st.markdown("---")
 st.markdown("""
@@ -366,4 +498,4 @@ st.markdown("""
     <p><strong>BioSat-Q+</strong> | Quantum-Secured Biomedical Satellite System</p>
     <p style='font-size: 0.9rem;'>QKD & Quantum ML simulated for demo | BioSat-Q.tech</p>
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)